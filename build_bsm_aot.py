@@ -0,0 +1,23 @@
+"""
+Ahead-of-time compilation of the Black & Scholes implied volatility kernel.
+
+Running this script produces modules/bsm_aot (a native extension) which modules/BSM.py imports when present,
+avoiding the JIT compilation of the implied volatility on the first run of a fresh deployment. The greeks grid is
+not exported: AOT compilation does not support parallel loops nor enforce the array layouts of its signature, and
+the JIT kernel is already cached on disk. numba.pycc is pending deprecation, so the build emits a warning.
+
+    python build_bsm_aot.py
+"""
+import os
+
+from numba.pycc import CC
+
+from modules import BSM
+
+cc = CC('bsm_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(BSM.__file__))
+
+cc.export('implied_vol', 'f8(f8, f8, f8, f8, f8, f8, f8, b1, f8, i8)')(BSM._implied_vol.py_func)
+
+if __name__ == '__main__':
+    cc.compile()
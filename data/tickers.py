@@ -1,5 +1,50 @@
+import os
+import pickle
+import tempfile
+import time
+
 import pandas as pd
+import streamlit as st
+
+SP500_URL = 'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies'
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'myderivatives', 'sp500.pkl')
+CACHE_TTL = 86400
 
 # Tickers
-sp500_tickers = pd.read_html('https://en.wikipedia.org/wiki/List_of_S%26P_500_companies')[0]
-sp500_tickers = {name: symbol for symbol, name in zip(sp500_tickers['Symbol'], sp500_tickers['Security'])}
\ No newline at end of file
+@st.cache_data(ttl=CACHE_TTL)
+def load_sp500_tickers() -> dict:
+    """Scrape the S&P 500 constituents, reusing the local copy if it is fresh or if Wikipedia is unreachable."""
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cached = pickle.load(f)
+        if time.time() - os.path.getmtime(CACHE_PATH) < CACHE_TTL:
+            return cached
+    except Exception:
+        # A missing, truncated or corrupt copy is treated as no cache
+        cached = None
+
+    try:
+        table = pd.read_html(SP500_URL)[0]
+    except Exception:
+        if cached is not None:
+            return cached
+        raise
+
+    sp500 = {name: symbol for symbol, name in zip(table['Symbol'], table['Security'])}
+
+    # Written to a temporary file then swapped in, so concurrent workers never read a partial copy.
+    # The local copy is optional, the scraped tickers are returned even when it can't be written.
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(CACHE_PATH), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(sp500, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return sp500
+
+sp500_tickers = load_sp500_tickers()
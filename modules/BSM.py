@@ -1,5 +1,197 @@
 import math
-from scipy.stats import norm
+from functools import cached_property, wraps
+
+import numpy as np
+from numba import njit, prange
+from scipy.special import ndtr
+
+
+@njit(fastmath=True, cache=True)
+def _ndtr(x):
+    """
+    Cumulative distribution function of a normal distribution, usable from jitted code.
+    """
+    return 0.5 * math.erfc(-x * 0.7071067811865476)
+
+
+@njit(fastmath=True, inline='always')
+def _ndtr_as(x):
+    """
+    Abramowitz & Stegun polynomial approximation of the normal cumulative distribution function (error ~7.5e-8).
+    Cheaper than the erfc based version in the hot loops of the greeks kernels.
+    """
+    t = 1 / (1 + 0.2316419 * abs(x))
+    poly = t * (0.319381530 + t * (-0.356563782 + t * (1.781477937 + t * (-1.821255978 + t * 1.330274429))))
+    y = 1 - 0.3989422804014327 * math.exp(-0.5 * x * x) * poly
+
+    return y if x >= 0 else 1 - y
+
+
+@njit(fastmath=True, inline='always')
+def _ndtr_logistic(x):
+    """
+    Logistic approximation of the normal cumulative distribution function (error ~1e-2).
+    Only meant for visual outputs such as the greeks surfaces.
+    """
+    return 1.0 / (1.0 + math.exp(-1.702 * x))
+
+
+# CDF variants of the kernels: Abramowitz & Stegun, logistic approximation and exact erfc based version
+CDF_AS, CDF_LOGISTIC, CDF_EXACT = 0, 1, 2
+
+
+@njit(fastmath=True, inline='always')
+def _kernel_cdf(x, cdf):
+    if cdf == CDF_LOGISTIC:
+        return _ndtr_logistic(x)
+    if cdf == CDF_EXACT:
+        return _ndtr(x)
+    return _ndtr_as(x)
+
+
+# Default CDF used by the greeks surfaces, the logistic approximation being used when True.
+# Numba freezes globals at compile time, so the flag is passed down to the kernels as an argument.
+BSM_FAST_CDF: bool = False
+
+
+@njit(fastmath=True, cache=True)
+def _bsm_kernel(S, K, T, r, q, sigma, is_call, target_code, cdf):
+    """
+    Computes the price or one greek of an European option, selected by its index in KERNEL_TARGETS.
+    Only the terms needed by the requested value are evaluated, cdf selecting the normal CDF variant.
+    """
+    sqrtT = math.sqrt(T)
+    sigmaSqrtT = sigma * sqrtT
+    discQ = math.exp(-q * T)
+
+    d1 = (math.log(S / K) + (r + sigma ** 2 / 2) * T) / sigmaSqrtT
+    d2 = d1 - sigmaSqrtT
+
+    # Calls and puts only differ by the sign of the CDF arguments and of the terms using them
+    phi = 1.0 if is_call else -1.0
+
+    if target_code == 0:  # price
+        return phi * (S * discQ * _kernel_cdf(phi * d1, cdf) -
+                      K * math.exp(-r * T) * _kernel_cdf(phi * d2, cdf))
+    if target_code == 1:  # delta
+        return phi * discQ * _kernel_cdf(phi * d1, cdf)
+    if target_code == 5:  # rho
+        return phi * K * T * math.exp(-r * T) * _kernel_cdf(phi * d2, cdf) * 0.01
+
+    nd1 = 0.3989422804014327 * math.exp(-0.5 * d1 * d1)
+
+    if target_code == 2:  # gamma
+        return nd1 * discQ / (S * sigmaSqrtT)
+    if target_code == 3:  # vega
+        return S * discQ * nd1 * sqrtT * 0.01
+    if target_code == 4:  # theta
+        Nsd1 = _kernel_cdf(phi * d1, cdf)
+        Nsd2 = _kernel_cdf(phi * d2, cdf)
+        theta = -discQ * S * nd1 * sigma / (2 * sqrtT) - phi * r * K * math.exp(-r * T) * Nsd2 + \
+            phi * q * S * discQ * Nsd1
+        return theta / 365
+    if target_code == 6:  # vanna
+        return -discQ * nd1 * (d2 / sigma) * 0.01
+    if target_code == 7:  # volga
+        return S * discQ * nd1 * sqrtT * (d1 * d2 / sigma) * 0.0001
+
+    drift = 2 * (r - q) * T - d2 * sigmaSqrtT
+
+    if target_code == 8:  # charm
+        charm = phi * q * discQ * _kernel_cdf(phi * d1, cdf) - discQ * nd1 * drift / (2 * T * sigmaSqrtT)
+        return charm / 365
+    if target_code == 9:  # color
+        color = -discQ * (nd1 / (2 * S * T * sigmaSqrtT)) * (2 * q * T + 1 + (drift / sigmaSqrtT) * d1)
+        return color / 365
+
+    # speed
+    return -discQ * (nd1 / (S ** 2 * sigmaSqrtT)) * ((d1 / sigmaSqrtT) + 1)
+
+
+@njit(fastmath=True, cache=True)
+def _implied_vol(mkt, S, K, T, r, q, sigma0, is_call, tol, maxit):
+    """
+    Newton-Raphson search of the volatility matching a market price.
+    Only the price and vega are evaluated at each step, and steps leaving the bracket of the root fall back to
+    bisection. After 10 failed Newton steps the search switches to bisection only.
+    Returns -1 when no volatility matches the price within tol, as fastmath kernels can't rely on NaN.
+    """
+    sqrtT = math.sqrt(T)
+    discR = math.exp(-r * T)
+    discQ = math.exp(-q * T)
+
+    # The price is increasing in volatility, so the root stays in [lo, hi]
+    lo = 0.0
+    hi = 10.0
+    sigma = sigma0 if lo < sigma0 < hi else 0.5 * (lo + hi)
+    phi = 1.0 if is_call else -1.0
+
+    diff = prevDiff = tol
+    failedSteps = 0
+
+    for k in range(maxit):
+        sigmaSqrtT = sigma * sqrtT
+        d1 = (math.log(S / K) + (r + sigma ** 2 / 2) * T) / sigmaSqrtT
+        d2 = d1 - sigmaSqrtT
+
+        price = phi * (S * discQ * _ndtr(phi * d1) - K * discR * _ndtr(phi * d2))
+
+        diff = price - mkt
+        if abs(diff) < tol:
+            break
+
+        if diff > 0:
+            hi = sigma
+        else:
+            lo = sigma
+
+        # A Newton step that did not reduce the pricing error counts as failed, the first error seeding the comparison
+        if k > 0 and abs(diff) >= abs(prevDiff):
+            failedSteps += 1
+        prevDiff = diff
+
+        vega = S * discQ * 0.3989422804014327 * math.exp(-0.5 * d1 * d1) * sqrtT
+        newSigma = sigma - diff / vega if vega > 0 and failedSteps < 10 else lo
+
+        if newSigma <= lo or newSigma >= hi:
+            newSigma = 0.5 * (lo + hi)
+
+        # The bracket collapsed on one of its edges without matching the price
+        if newSigma == sigma:
+            break
+
+        sigma = newSigma
+
+    return sigma if abs(diff) < tol else -1.0
+
+
+# Values computed by the kernel, a target being selected by its index
+KERNEL_TARGETS = ('price', 'delta', 'gamma', 'vega', 'theta', 'rho', 'vanna', 'volga', 'charm', 'color', 'speed')
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _bsm_grid(S_arr, K_arr, T_arr, r_arr, q_arr, sigma_arr, is_call, target_code, fast_cdf, out):
+    """
+    Computes one value of the kernel (selected by its index in KERNEL_TARGETS) over 2D arrays of parameters,
+    writing it into out. Rows are processed in parallel.
+    """
+    M, N = S_arr.shape
+
+    for i in prange(M):
+        for j in range(N):
+            out[i, j] = _bsm_kernel(S_arr[i, j], K_arr[i, j], T_arr[i, j], r_arr[i, j], q_arr[i, j],
+                                    sigma_arr[i, j], is_call, target_code,
+                                    CDF_LOGISTIC if fast_cdf else CDF_AS)
+
+    return out
+
+
+# The ahead-of-time compiled implied volatility (see build_bsm_aot.py) skips the JIT compilation when it has been built.
+# The grid always uses the parallel JIT kernel, whose compilation is already reused across runs by cache=True.
+try:
+    from modules.bsm_aot import implied_vol as _implied_vol_impl
+except ImportError:
+    _implied_vol_impl = _implied_vol
 
 
 class BlackScholesOption:
@@ -21,6 +213,7 @@ class BlackScholesOption:
         # Parameters
         self.type = str(option_type)
         self.style = str(option_style)
+        self._is_call: int = 1 if option_type == 'Call' else -1
         self.S = float(S)
         self.K = float(K)
         self.r = float(r)
@@ -29,56 +222,140 @@ class BlackScholesOption:
         self.q = float(q)
 
         # Calculations
+        self._sqrtT = math.sqrt(self.T)
         self.d1 = self.d1()
         self.d2 = self.d2()
 
-        self.price = self.optionPrice()
+        # Invariants shared by the greeks
+        self._discR = math.exp(-self.r * self.T)
+        self._discQ = math.exp(-self.q * self.T)
+        self._nd1 = self.n(self.d1)
+        # N(d1) and N(d2) for calls, N(-d1) and N(-d2) for puts
+        self._Nsd1 = self.N(self._is_call * self.d1)
+        self._Nsd2 = self.N(self._is_call * self.d2)
 
-        self.delta = self.optionDelta()
-        self.gamma = self.optionGamma()
-        self.vega = self.optionVega()
-        self.theta = self.optionTheta()
-        self.rho = self.optionRho()
+    def _kernel_value(self, target: str) -> float:
+        """
+        Computes a single target with the compiled kernel, using the exact normal CDF.
+        """
+        return _bsm_kernel(self.S, self.K, self.T, self.r, self.q, self.sigma, self.type == 'Call',
+                           KERNEL_TARGETS.index(target), CDF_EXACT)
+
+    # Greeks, computed on first access only
+    @cached_property
+    def price(self) -> float:
+        return self._kernel_value('price')
+
+    @cached_property
+    def delta(self) -> float:
+        return self._kernel_value('delta')
+
+    @cached_property
+    def gamma(self) -> float:
+        return self._kernel_value('gamma')
+
+    @cached_property
+    def vega(self) -> float:
+        return self._kernel_value('vega')
+
+    @cached_property
+    def theta(self) -> float:
+        return self._kernel_value('theta')
+
+    @cached_property
+    def rho(self) -> float:
+        return self._kernel_value('rho')
+
+    @cached_property
+    def vanna(self) -> float:
+        return self._kernel_value('vanna')
+
+    @cached_property
+    def volga(self) -> float:
+        return self._kernel_value('volga')
+
+    @cached_property
+    def charm(self) -> float:
+        return self._kernel_value('charm')
+
+    @cached_property
+    def color(self) -> float:
+        return self._kernel_value('color')
+
+    @cached_property
+    def speed(self) -> float:
+        return self._kernel_value('speed')
+
+    @cached_property
+    def gearing(self) -> float:
+        return self.optionLambda()
+
+    @cached_property
+    def epsilon(self) -> float:
+        return self.optionEpsilon()
 
-        self.vanna = self.optionVanna()
-        self.volga = self.optionVolga()
-        self.charm = self.optionCharm()
-        self.color = self.optionColor()
-        self.speed = self.optionSpeed()
+    @classmethod
+    def vectorized(cls, S, K, T, r, q, sigma, option_type: str, target: str):
+        """
+        Computes a single target (price or greek) over NumPy arrays of parameters.
+        Inputs are broadcast together, so fixed parameters can be passed as scalars.
+        """
+        assert option_type in ['Call', 'Put'], "Option type must be either Call or Put"
+        assert target in KERNEL_TARGETS, f"Unsupported target: {target}"
+
+        greek_fn = getattr(BlackScholesBatch, target)
+
+        return greek_fn(BlackScholesBatch(S, K, T, r, q, sigma, option_type))
+
+    @classmethod
+    def grid(cls, S, K, T, r, q, sigma, option_type: str, target: str, fast_cdf=None, out=None):
+        """
+        Computes a single target (price or greek) over a 2D grid of parameters with the parallel compiled kernel.
+        Inputs are broadcast together, so fixed parameters can be passed as scalars.
+        Results are written into out (a float64 array of the grid shape) when given.
+        fast_cdf selects the logistic CDF approximation, defaulting to BSM_FAST_CDF.
+        """
+        assert option_type in ['Call', 'Put'], "Option type must be either Call or Put"
+        assert target in KERNEL_TARGETS, f"Unsupported target: {target}"
+
+        arrays = np.broadcast_arrays(*(np.atleast_2d(np.asarray(x, dtype=np.float64)) for x in (S, K, T, r, q, sigma)))
+        arrays = [np.ascontiguousarray(x) for x in arrays]
+
+        if fast_cdf is None:
+            fast_cdf = BSM_FAST_CDF
+        if out is None:
+            out = np.empty(arrays[0].shape, dtype=np.float64)
+        elif out.shape != arrays[0].shape or out.dtype != np.float64 or not out.flags.c_contiguous:
+            # The kernel runs without bounds checks, a mismatched buffer would be written out of bounds
+            raise ValueError(f"out must be a C-contiguous float64 array of shape {arrays[0].shape}")
 
-        self.gearing = self.optionLambda()
-        self.epsilon = self.optionEpsilon()
+        return _bsm_grid(*arrays, option_type == 'Call', KERNEL_TARGETS.index(target), bool(fast_cdf), out)
 
     def N(self, x):
         """
         Cumulative distribution function of a normal distribution.
         """
-        return norm.cdf(x, 0, 1)
+        return ndtr(x)
 
     def n(self, x):
         """
         Probability density function of a normal distribution.
         """
-        return norm.pdf(x, 0, 1)
+        return 0.3989422804014327 * math.exp(-0.5 * x * x)
 
     def d1(self):
         d1 = (math.log(self.S / self.K) + (self.r + self.sigma ** 2 / 2) * self.T) / \
-             (self.sigma * math.sqrt(self.T))
+             (self.sigma * self._sqrtT)
 
         return d1
 
     def d2(self):
-        d2 = self.d1 - self.sigma * math.sqrt(self.T)
+        d2 = self.d1 - self.sigma * self._sqrtT
 
         return d2
 
     def optionPrice(self) -> float:
-        if self.type == 'Put':
-            price = self.K * math.exp(-self.r * self.T) * self.N(-self.d2) - self.S * math.exp(
-                -self.q * self.T) * self.N(-self.d1)
-        elif self.type == 'Call':
-            price = self.S * math.exp(-self.q * self.T) * self.N(self.d1) - self.K * math.exp(
-                -self.r * self.T) * self.N(self.d2)
+        price = self._is_call * (self.S * self._discQ * self._Nsd1 - self.K * self._discR * self._Nsd2)
 
         return price
 
@@ -86,10 +363,7 @@ class BlackScholesOption:
         """
         Rate of change of the theoretical option value with respect to changes in the underlying price.
         """
-        if self.type == 'Put':
-            delta = -math.exp(-self.q * self.T) * self.N(-self.d1)
-        elif self.type == 'Call':
-            delta = math.exp(-self.q * self.T) * self.N(self.d1)
+        delta = self._is_call * self._discQ * self._Nsd1
 
         return delta
 
@@ -97,7 +371,7 @@ class BlackScholesOption:
         """
         Rate of change in the delta with respect to changes in the underlying price.
         """
-        gamma = (self.n(self.d1) * math.exp(-self.q * self.T)) / (self.S * self.sigma * math.sqrt(self.T))
+        gamma = (self._nd1 * self._discQ) / (self.S * self.sigma * self._sqrtT)
 
         return gamma
 
@@ -105,7 +379,7 @@ class BlackScholesOption:
         """
         Sensivity of the option theoretical value with respect to changes in the volatility.
         """
-        vega = self.S * math.exp(-self.q * self.T) * self.n(self.d1) * math.sqrt(self.T)
+        vega = self.S * self._discQ * self._nd1 * self._sqrtT
 
         return vega * 0.01
 
@@ -113,16 +387,8 @@ class BlackScholesOption:
         """
         Sensivity of the option theoretical value over the passage of time.
         """
-        if self.type == 'Put':
-            theta = -math.exp(-self.q * self.T) * (self.S * self.n(self.d1) * self.sigma) / (
-                        2 * math.sqrt(self.T)) + self.r * \
-                    self.K * math.exp(-self.r * self.T) * self.N(-self.d2) - self.q * self.S * math.exp(
-                -self.q * self.T) * self.N(-self.d1)
-        elif self.type == 'Call':
-            theta = - math.exp(-self.q * self.T) * (self.S * self.n(self.d1) * self.sigma) / (
-                        2 * math.sqrt(self.T)) - self.r * \
-                    self.K * math.exp(-self.r * self.T) * self.N(self.d2) + self.q * self.S * math.exp(
-                -self.q * self.T) * self.N(self.d1)
+        theta = -self._discQ * (self.S * self._nd1 * self.sigma) / (2 * self._sqrtT) - self._is_call * (
+                self.r * self.K * self._discR * self._Nsd2 - self.q * self.S * self._discQ * self._Nsd1)
 
         return theta / 365
 
@@ -130,10 +396,7 @@ class BlackScholesOption:
         """
         Sensivity of the option price to changes in interest rates.
         """
-        if self.type == 'Put':
-            rho = -self.K * self.T * math.exp(-self.r * self.T) * self.N(-self.d2)
-        elif self.type == 'Call':
-            rho = self.K * self.T * math.exp(-self.r * self.T) * self.N(self.d2)
+        rho = self._is_call * self.K * self.T * self._discR * self._Nsd2
         return rho * 0.01
 
     def optionLambda(self) -> float:
@@ -151,10 +414,7 @@ class BlackScholesOption:
         Epsilon. Called psi.
         Represents the percentage change in option value per percentage change in the underlying dividend yield.
         """
-        if self.type == 'Put':
-            epsilon = self.S * self.r * math.exp(-self.q * self.T) * self.N(-self.d1)
-        elif self.type == 'Call':
-            epsilon = - self.S * self.r * math.exp(-self.q * self.T) * self.N(self.d1)
+        epsilon = -self._is_call * self.S * self.r * self._discQ * self._Nsd1
 
         return epsilon
 
@@ -163,7 +423,7 @@ class BlackScholesOption:
         Sensitivity of the option delta with respect to change in volatility or,
         alternatively, the partial of vega with respect to the underlying instrument's price.
         """
-        vanna = - math.exp(-self.q * self.T) * self.n(self.d1) * (self.d2 / self.sigma)
+        vanna = - self._discQ * self._nd1 * (self.d2 / self.sigma)
 
         return vanna * 0.01
 
@@ -172,8 +432,7 @@ class BlackScholesOption:
         Vomma or Volga measures the rate of change to vega as volatility changes.
         It is the second order price sensivity to volatility.
         """
-        volga = self.S * math.exp(-self.q * self.T) * self.n(self.d1) * math.sqrt(self.T) * (
-                    self.d1 * self.d2 / self.sigma)
+        volga = self.S * self._discQ * self._nd1 * self._sqrtT * (self.d1 * self.d2 / self.sigma)
 
         return volga * 0.0001
 
@@ -182,16 +441,10 @@ class BlackScholesOption:
         Charm is a second-order derivative of the option value, once to price and once to the passage of time.
         It is also then the derivative of theta with respect to the underlying's price.
         """
-        if self.type == 'Put':
-            charm = -self.q * math.exp(-self.q * self.T) * self.N(-self.d1) - math.exp(-self.q * self.T) * self.n(
-                self.d1) * \
-                    (2 * (self.r - self.q) * self.T - self.d2 * self.sigma * math.sqrt(self.T)) / (
-                                2 * self.T * self.sigma * math.sqrt(self.T))
-        elif self.type == 'Call':
-            charm = self.q * math.exp(-self.q * self.T) * self.N(self.d1) - math.exp(-self.q * self.T) * self.n(
-                self.d1) * \
-                    (2 * (self.r - self.q) * self.T - self.d2 * self.sigma * math.sqrt(self.T)) / (
-                                2 * self.T * self.sigma * math.sqrt(self.T))
+        drift = self._discQ * self._nd1 * (2 * (self.r - self.q) * self.T - self.d2 * self.sigma * self._sqrtT) / \
+                (2 * self.T * self.sigma * self._sqrtT)
+
+        charm = self._is_call * self.q * self._discQ * self._Nsd1 - drift
 
         return charm / 365
 
@@ -199,11 +452,10 @@ class BlackScholesOption:
         """
         Rate of change in the gamma over the passage of time.
         """
-        color = -math.exp(-self.q * self.T) * (
-                    self.n(self.d1) / (2 * self.S * self.T * self.sigma * math.sqrt(self.T))) * \
+        color = -self._discQ * (self._nd1 / (2 * self.S * self.T * self.sigma * self._sqrtT)) * \
                 (2 * self.q * self.T + 1 + (
-                            (2 * (self.r - self.q) * self.T - self.d2 * self.sigma * math.sqrt(self.T)) / (
-                                self.sigma * math.sqrt(self.T))) * self.d1)
+                            (2 * (self.r - self.q) * self.T - self.d2 * self.sigma * self._sqrtT) / (
+                                self.sigma * self._sqrtT)) * self.d1)
 
         return color / 365
 
@@ -211,8 +463,8 @@ class BlackScholesOption:
         """
         Rate of change in the gamma with respect to changes in the underlying price.
         """
-        speed = -math.exp(-self.q * self.T) * (self.n(self.d1) / (self.S ** 2 * self.sigma * math.sqrt(self.T))) * \
-                ((self.d1 / (self.sigma * math.sqrt(self.T))) + 1)
+        speed = -self._discQ * (self._nd1 / (self.S ** 2 * self.sigma * self._sqrtT)) * \
+                ((self.d1 / (self.sigma * self._sqrtT)) + 1)
 
         return speed
 
@@ -220,44 +472,149 @@ class BlackScholesOption:
         """
         Derives the implied volatility of an European Option with Newton-Raphson Algorithm
         """
-        S = self.S
-        K = self.K
-        T = self.T * 365
-        r = self.r * 100
-        q = self.q * 100
-        oldVolatility = self.sigma * 100
-
         maxIterations = 500
 
-        for k in range(maxIterations):
+        # Start high enough in volatility for Newton steps to stay well-behaved
+        initialVolatility = max(0.5, self.sigma)
+
+        impliedVolatility = _implied_vol_impl(float(marketPrice), self.S, self.K, self.T, self.r, self.q,
+                                              initialVolatility, self.type == 'Call', tolerance, maxIterations)
 
-            newInstance = BlackScholesOption(S, K, T, r, q, oldVolatility, self.type, self.style)
-            theoPrice = newInstance.price
-            optionPremium = newInstance.vega * 100
-            OptionPrice = theoPrice - marketPrice
-            newVolatility = oldVolatility - OptionPrice / optionPremium
+        # No volatility matches the market price (e.g. a price outside the no-arbitrage bounds)
+        if impliedVolatility < 0:
+            return math.nan
 
-            if newVolatility < 0:
-                continue
+        return impliedVolatility
 
-            newTheoPrice = BlackScholesOption(S, K, T, r, q, newVolatility, self.type, self.style).price
+    def optionPayoff(self, St):
 
-            if (abs(oldVolatility - newVolatility) < tolerance or abs(newTheoPrice - marketPrice) < tolerance):
-                break
-            oldVolatility = newVolatility
+        payoff = max(self._is_call * (St - self.K), 0)
 
-        impliedVolatility = oldVolatility
+        return payoff
 
-        return impliedVolatility
 
-    def optionPayoff(self, St):
+def _cached_greek(method):
+    """
+    Caches the array returned by a BlackScholesBatch greek, so that it is only computed on first call.
+    """
+    @wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._greeks:
+            self._greeks[method.__name__] = method(self)
+        return self._greeks[method.__name__]
+
+    return wrapper
+
+
+class BlackScholesBatch:
+    """
+    Black & Scholes batch of european style options, stored as parallel NumPy arrays.
+    Inputs are broadcast together, so fixed parameters can be passed as scalars.
+    Greeks are computed lazily and share d1, d2, the discount factors and the distribution values.
+    """
+
+    def __init__(self, S, K, T, r, q, sigma, option_type: str):
+
+        assert option_type in ['Call', 'Put'], "Option type must be either Call or Put"
 
-        if self.type == 'Call':
+        # Parameters
+        self.type = str(option_type)
+        self.S, self.K, self.T, self.r, self.q, self.sigma = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, q, sigma)))
+        self._is_call: int = 1 if option_type == 'Call' else -1
+
+        assert np.all(self.sigma >= 0), "Volatility can't be less than zero"
+        assert np.all(self.S >= 0), "Initial stock value can't be less than zero"
+        assert np.all(self.K >= 0), "Strike price can't be less than zero"
+        assert np.all(self.T >= 0), "Time to maturity can't be less than zero"
+        assert np.all(self.q >= 0), "Dividend yield cannot be less than zero"
+
+        self._greeks = {}
+
+    @cached_property
+    def _sqrtT(self):
+        return np.sqrt(self.T)
+
+    @cached_property
+    def d1(self):
+        return (np.log(self.S / self.K) + (self.r + self.sigma ** 2 / 2) * self.T) / (self.sigma * self._sqrtT)
 
-            payoff = max(St - self.K, 0)
+    @cached_property
+    def d2(self):
+        return self.d1 - self.sigma * self._sqrtT
+
+    @cached_property
+    def _discR(self):
+        return np.exp(-self.r * self.T)
+
+    @cached_property
+    def _discQ(self):
+        return np.exp(-self.q * self.T)
+
+    @cached_property
+    def _nd1(self):
+        return (1 / np.sqrt(2 * np.pi)) * np.exp(-0.5 * self.d1 * self.d1)
+
+    # N(d1) and N(d2) for calls, N(-d1) and N(-d2) for puts
+    @cached_property
+    def _Nsd1(self):
+        return ndtr(self._is_call * self.d1)
+
+    @cached_property
+    def _Nsd2(self):
+        return ndtr(self._is_call * self.d2)
+
+    @_cached_greek
+    def price(self):
+        return self._is_call * (self.S * self._discQ * self._Nsd1 - self.K * self._discR * self._Nsd2)
+
+    @_cached_greek
+    def delta(self):
+        return self._is_call * self._discQ * self._Nsd1
+
+    @_cached_greek
+    def gamma(self):
+        return self._nd1 * self._discQ / (self.S * self.sigma * self._sqrtT)
+
+    @_cached_greek
+    def vega(self):
+        return self.S * self._discQ * self._nd1 * self._sqrtT * 0.01
+
+    @_cached_greek
+    def theta(self):
+        decay = -self._discQ * self.S * self._nd1 * self.sigma / (2 * self._sqrtT)
+        theta = decay - self._is_call * (self.r * self.K * self._discR * self._Nsd2 -
+                                         self.q * self.S * self._discQ * self._Nsd1)
+        return theta / 365
+
+    @_cached_greek
+    def rho(self):
+        return self._is_call * self.K * self.T * self._discR * self._Nsd2 * 0.01
+
+    @_cached_greek
+    def vanna(self):
+        return -self._discQ * self._nd1 * (self.d2 / self.sigma) * 0.01
 
-        elif self.type == 'Put':
+    @_cached_greek
+    def volga(self):
+        return self.vega() * (self.d1 * self.d2 / self.sigma) * 0.01
 
-            payoff = max(self.K - St, 0)
+    @_cached_greek
+    def charm(self):
+        drift = self._discQ * self._nd1 * (2 * (self.r - self.q) * self.T - self.d2 * self.sigma * self._sqrtT) / \
+                (2 * self.T * self.sigma * self._sqrtT)
+        charm = self._is_call * self.q * self._discQ * self._Nsd1 - drift
+        return charm / 365
+
+    @_cached_greek
+    def color(self):
+        sigmaSqrtT = self.sigma * self._sqrtT
+        color = -self._discQ * (self._nd1 / (2 * self.S * self.T * sigmaSqrtT)) * \
+                (2 * self.q * self.T + 1 + ((2 * (self.r - self.q) * self.T - self.d2 * sigmaSqrtT) / sigmaSqrtT) *
+                 self.d1)
+        return color / 365
 
-        return payoff
\ No newline at end of file
+    @_cached_greek
+    def speed(self):
+        sigmaSqrtT = self.sigma * self._sqrtT
+        return -self._discQ * (self._nd1 / (self.S ** 2 * sigmaSqrtT)) * ((self.d1 / sigmaSqrtT) + 1)
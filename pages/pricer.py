@@ -2,6 +2,7 @@ import streamlit as st
 from matplotlib import pyplot as plt
 import yfinance as yf
 import pandas as pd
+import numpy as np
 import datetime
 import lxml
 
@@ -19,6 +20,9 @@ paramValuesDict = {
     'Style':'option_style'
 }
 
+# Order of the pricing arguments that can be used as risk factors
+pricingArgs = ('S', 'K', 'T', 'r', 'q', 'sigma')
+
 targetValuesDict = {
     "Option Price": "price", "Delta": "delta", "Gamma": "gamma", "Vega": "vega", "Theta": "theta", "Rho": "rho",
     "Vanna": "vanna", "Volga": "volga"
@@ -52,17 +56,26 @@ option_type = characteristics.selectbox("What is the option type?",
 exercise_style = characteristics.selectbox("What should be the exercise style?",
                              ('European'))
 
+# Market data, cached so that widget interactions do not hit Yahoo again
+@st.cache_data(ttl=900)
+def _market_data(ticker: str) -> tuple[float, float, float]:
+    # Spot and risk-free rate in a single batched request
+    data = yf.download([ticker, '^TNX'], period='1d', progress=False, group_by='ticker')
+
+    price = data[ticker]['Close'].dropna().iloc[0]
+    risk_free = data['^TNX']['Close'].dropna().iloc[0]
+
+    try:
+        div_yield = yf.Ticker(ticker).info.get('dividendYield')
+    except:
+        div_yield = 0.00
+
+    return price, div_yield, risk_free
+
 # Get target stock yahoo price
 ticker = underlyings['SP500'][stock]
-ticker_tf = yf.Ticker(ticker)
-
-price = ticker_tf.history(period='1d')['Close'].iloc[0]
-try:
-    div_yield = ticker_tf.info.get('dividendYield')
-except:
-    div_yield = 0.00
 
-risk_free = yf.Ticker('^TNX').history(period='1d')['Close'].iloc[0]
+price, div_yield, risk_free = _market_data(ticker)
 
 # Parameters
 parameters = {
@@ -83,7 +96,6 @@ parameters['Rate'] /= 100; parameters['Vol'] /= 100; parameters['Div'] /= 100
 # Run pricing algorithm
 option_price = 0
 
-@st.cache_data
 def price_option(parameters, option_type, exercise_style):
     option_price = None
 
@@ -94,6 +106,11 @@ def price_option(parameters, option_type, exercise_style):
 
     return option_price
 
+@st.cache_data(max_entries=256)
+def price_option_surface(S, K, T, r, q, sigma, option_type, target, fast_cdf=False) -> np.ndarray:
+    # Compute target values over the whole grid in parallel, grid allocating the float64 storage
+    return BSM.BlackScholesOption.grid(S, K, T, r, q, sigma, option_type, target, fast_cdf=fast_cdf)
+
 if not st.button("Price"):
     pass
 else:
@@ -126,6 +143,9 @@ secondary_factor = secondary_factors.selectbox("Choose the second factor",
 
 risk_granularity = risks.number_input('Granularity.', value=30, step=1, max_value=100, min_value=1)
 
+# The approximation only applies to the 3D surfaces, the 2D line being priced exactly
+fast_surface = risks.checkbox("Fast surface (approx)") if secondary_factor else False
+
 first_param_range = primary_factors.number_input('Parameter range.', value=0.90, step=0.01, max_value=0.99,
                                                  min_value=0.1, key="#P1R")
 if secondary_factor and secondary_factor != 'Maturity':
@@ -148,22 +168,25 @@ for k, v in params.items():
 
 if params_check:
 
+    # Fixed pricing arguments, the risk factors being substituted by index
+    base = tuple(params[arg] for arg in pricingArgs)
+    first_idx = pricingArgs.index(paramValuesDict[primary_factor])
+    attr_name = targetValuesDict[risk]
+
     # 2D Risk modelling
     if secondary_factor is None:
 
         # Create linear space for the first factor
         first_factor_lin_space = utils.create_linear_spaces_risk_factors(primary_factor, parameters, first_param_range, risk_granularity)
 
-        # Replace first value with a small number if necessary
+        # Replace first value with a small number if necessary, on a copy as cached linear spaces are read-only
         if primary_factor == 'Maturity':
+            first_factor_lin_space = first_factor_lin_space.copy()
             first_factor_lin_space[0] = 1e-05
 
-        # Compute target values
-        target_values = [
-            getattr(BSM.BlackScholesOption(**{**params, paramValuesDict[primary_factor]: firstParam}),
-                    targetValuesDict[risk])
-            for firstParam in first_factor_lin_space
-        ]
+        # Compute target values over the whole linear space at once
+        args = base[:first_idx] + (first_factor_lin_space,) + base[first_idx + 1:]
+        target_values = BSM.BlackScholesOption.vectorized(*args, params['option_type'], attr_name)
 
         # Convert to series
         target_values = pd.DataFrame(target_values, index=first_factor_lin_space, columns=[risk])
@@ -172,10 +195,8 @@ if params_check:
     elif not secondary_factor is None:
 
         # Create linear spaces for risk factors
-        first_factor_lin_space = utils.create_linear_spaces_risk_factors(primary_factor, parameters,
-                                                                         first_param_range, risk_granularity)
-        second_param_lin_space = utils.create_linear_spaces_risk_factors(secondary_factor, parameters,
-                                                                         second_param_range, risk_granularity)
+        first_factor_lin_space, second_param_lin_space = utils.build_all_linear_spaces(
+            parameters, (primary_factor, secondary_factor), (first_param_range, second_param_range), risk_granularity)
 
         if primary_factor == 'Maturity':
             first_factor_lin_space[0] = 1e-05
@@ -183,20 +204,17 @@ if params_check:
         if secondary_factor == 'Maturity':
             second_param_lin_space[0] = 1e-05
 
-        # Set target values storage
-        target_values = pd.DataFrame(columns=first_factor_lin_space, index=second_param_lin_space)
-
-        for firstParam in first_factor_lin_space:
-            for secondParam in second_param_lin_space:
-
-                params[paramValuesDict[primary_factor]] = firstParam
-                params[paramValuesDict[secondary_factor]] = secondParam
+        # Build the grid of risk factors, rows follow the second factor and columns the first one
+        first_grid, second_grid = np.meshgrid(first_factor_lin_space, second_param_lin_space)
+        second_idx = pricingArgs.index(paramValuesDict[secondary_factor])
+        args = base[:first_idx] + (first_grid,) + base[first_idx + 1:]
+        args = args[:second_idx] + (second_grid,) + args[second_idx + 1:]
 
-                # Get option instance
-                option = BSM.BlackScholesOption(**params)
+        # Compute target values over the whole grid
+        target_values = price_option_surface(*args, params['option_type'], attr_name, fast_surface)
 
-                # Create dataframe
-                target_values.at[secondParam, firstParam] = getattr(option, targetValuesDict[risk])
+        # Create dataframe
+        target_values = pd.DataFrame(target_values, index=second_param_lin_space, columns=first_factor_lin_space)
 
     # Show results
     if secondary_factor is None and not target_values.empty: # 2D Graph
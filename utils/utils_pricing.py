@@ -1,53 +1,155 @@
-import plotly.graph_objects as go
 import numpy as np
+from functools import lru_cache
+from numba import njit, prange
+from typing import NamedTuple
 
-# Function to calculate bounds and step for linear spaces
-def calculate_bounds_and_step(factor, parameters, RISK_RANGE, RISK_GRANULARITY):
-    """Helper function to calculate bounds and step size for the linear space."""
-    if factor == 'Maturity':
-        lower_bound = 0
-        upper_bound = parameters[factor]
-        step = upper_bound / RISK_GRANULARITY
-    else:
-        lower_bound = parameters[factor] * (1 - RISK_RANGE)
-        upper_bound = parameters[factor] * (1 + RISK_RANGE)
-        step = (upper_bound - lower_bound) / RISK_GRANULARITY
-    return lower_bound, upper_bound, step
+# Bounds and number of points of a linear space
+class Bounds(NamedTuple):
+    lb: float
+    ub: float
+    n: int
+
+    @property
+    def step(self) -> float:
+        return (self.ub - self.lb) / self.n
+
+# Bounds of a linear space, maturity spaces starting from 0 and the others spanning the risk range around the value
+def _bounds(param_value, is_maturity, risk_range):
+    if is_maturity:
+        return 0.0, param_value
+    return param_value * (1.0 - risk_range), param_value * (1.0 + risk_range)
+
+# Compiled copy of _bounds, inlined into the fill kernels
+_bounds_jit = njit(inline='always')(_bounds)
+
+# Function to calculate bounds and number of points for linear spaces
+def calculate_bounds_and_step(factor, parameters, RISK_RANGE, RISK_GRANULARITY) -> Bounds:
+    """Helper function to calculate bounds and number of points for the linear space."""
+    lower_bound, upper_bound = _bounds(parameters[factor], factor == 'Maturity', RISK_RANGE)
+    return Bounds(lower_bound, upper_bound, int(RISK_GRANULARITY))
+
+# Function to calculate the bounds of several linear spaces at once
+def compute_bounds(param_values, is_maturity, risk_range):
+    """Branchless bounds of the linear spaces, maturity spaces starting from 0 and the others spanning the risk range
+    around the parameter value."""
+    lbounds = np.where(is_maturity, 0.0, param_values * (1 - risk_range))
+    ubounds = np.where(is_maturity, param_values, param_values * (1 + risk_range))
+    return lbounds, ubounds
+
+# Compiled kernel filling a linear space in place
+@njit(cache=True, fastmath=True)
+def _fill_grid(param_value, is_maturity, risk_range, n, out):
+    """Linear space between the _bounds of the factor, filled as lb + i * (ub - lb) / n."""
+    lb, ub = _bounds_jit(param_value, is_maturity, risk_range)
+    inv = (ub - lb) / n
+
+    for i in range(n):
+        out[i] = lb + i * inv
+
+# Compiled kernel filling the linear spaces of several factors in parallel, one row of out per factor
+@njit(parallel=True, cache=True, fastmath=True)
+def _fill_all(param_values, is_maturity, risk_ranges, n, out):
+    for k in prange(param_values.shape[0]):
+        _fill_grid(param_values[k], is_maturity[k], risk_ranges[k], n, out[k])
+
+# Function to create a read-only linear space, cached as it is shared between callers
+@lru_cache(maxsize=1024)
+def _cached_linspace(param_value, is_maturity, risk_range, n):
+    lin_space = np.empty(n, dtype=np.float64)
+    _fill_grid(param_value, is_maturity, risk_range, n, lin_space)
+    lin_space.setflags(write=False)
+    return lin_space
 
 # Function to create linear spaces for risk factors
-def create_linear_spaces_risk_factors(factor, parameters, risk_range, risk_granularity):
+def create_linear_spaces_risk_factors(factor, parameters, risk_range, risk_granularity, out=None):
+    """Read-only linear space of n = risk_granularity points, cached across identical calls. It is copied into out
+    (a float64 buffer of n points) when given, for callers that need a writable array."""
 
-    # Calculate bounds and step size
-    lbound, ubound, step = calculate_bounds_and_step(factor, parameters, risk_range, risk_granularity)
+    # Always n points unlike a float step arange
+    lin_space_risk_factor = _cached_linspace(float(parameters[factor]), factor == 'Maturity', float(risk_range),
+                                             int(risk_granularity))
 
-    # Create lin_space
-    lin_space_risk_factor = np.arange(lbound, ubound, step)
+    if out is not None:
+        np.copyto(out, lin_space_risk_factor)
+        return out
 
     return lin_space_risk_factor
 
-# Function to plot the surface
-def plot_surface(data, x_label, y_label, z_label):
+# Risk factors grid, one contiguous row per factor
+class RiskGrid(NamedTuple):
+    values: np.ndarray
+    factors: tuple
+
+# Function to build the grid of several risk factors at once
+def build_risk_grid(parameters, factors, risk_range, risk_granularity) -> RiskGrid:
+    """Linear spaces of all factors as a (len(factors), risk_granularity) float64 matrix, rows being filled in
+    parallel. risk_range is either shared by all factors or given per factor."""
+    factors = tuple(factors)
+    param_values = np.array([parameters[factor] for factor in factors], dtype=np.float64)
+    is_maturity = np.array([factor == 'Maturity' for factor in factors])
+    risk_ranges = np.ascontiguousarray(np.broadcast_to(np.asarray(risk_range, dtype=np.float64), param_values.shape))
+
+    values = np.empty((len(factors), int(risk_granularity)), dtype=np.float64)
+    _fill_all(param_values, is_maturity, risk_ranges, int(risk_granularity), values)
 
-    # Create a meshgrid for plotting based on the DataFrame index and columns
-    x = data.columns
-    y = data.index
-    z = data.values
+    return RiskGrid(values, factors)
+
+# Function to create linear spaces for several risk factors at once
+def build_all_linear_spaces(parameters, factors, risk_range, risk_granularity):
+    """Linear spaces of all factors as a (len(factors), risk_granularity) matrix."""
+    return build_risk_grid(parameters, factors, risk_range, risk_granularity).values
+
+# Static parts of the surface layout
+_BASE_SCENE = dict(camera=dict(eye=dict(x=1.3, y=1.3, z=1.3)))  # Adjust x, y, z for zoom
+_BASE_MARGIN = dict(l=10, r=10, t=40, b=10)  # Margin values
+
+# Function to plot the surface from arrays, z being of shape (len(y), len(x))
+def plot_surface_arr(z, x, y, x_label, y_label, z_label, max_cells=20000, mode='auto', heatmap_cells=40000,
+                     showscale=False):
+    """Surface of z, or a 2D heatmap when mode is 'heatmap' (picked by 'auto' above heatmap_cells points).
+    The surface colorbar is only drawn with showscale."""
+
+    # Plotly is only imported when plotting, keeping the pricing helpers light to import
+    import plotly.graph_objects as go
+
+    # Single precision halves the payload sent to the browser, which is more than enough for plotting
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    z = np.asarray(z, dtype=np.float32)
+
+    title = f"{z_label} as function of {x_label} and {y_label}"
+
+    # Very large grids are drawn as a heatmap, a single texture instead of a full triangle mesh
+    if mode == 'auto':
+        mode = 'heatmap' if z.size > heatmap_cells else 'surface'
+
+    if mode == 'heatmap':
+        fig = go.Figure(data=[go.Heatmap(z=np.ascontiguousarray(z), x=x, y=y, colorscale='Plasma',
+                                         colorbar=dict(title=z_label))])
+        fig.update_layout(title=title, xaxis_title=x_label, yaxis_title=y_label, margin=_BASE_MARGIN)
+        return fig
+
+    # Downsample large grids so that the browser renders at most max_cells points
+    stride = max(1, int(np.ceil(np.sqrt(z.size / max_cells))))
+    if stride > 1:
+        z = z[::stride, ::stride]
+        x = x[::stride]
+        y = y[::stride]
+
+    z = np.ascontiguousarray(z)
 
     # Plotly surface plot
-    fig = go.Figure(data=[go.Surface(z=z, x=x, y=y, colorscale='Plasma')])
+    # Contour projections and specular lighting are disabled to keep the rendering light
+    surface = go.Surface(z=z, x=x, y=y, colorscale='Plasma', showscale=showscale,
+                         contours=dict(x=dict(show=False), y=dict(show=False), z=dict(show=False)),
+                         lighting=dict(ambient=0.8, diffuse=0.2, specular=0.0))
+    fig = go.Figure(data=[surface], layout=dict(margin=_BASE_MARGIN, scene=_BASE_SCENE))
 
     # Update layout for labels
-    fig.update_layout(
-        title=f"{z_label} as function of {x_label} and {y_label}",
-        scene=dict(
-            xaxis_title=x_label,
-            yaxis_title=y_label,
-            zaxis_title=z_label,
-            camera = dict(
-                eye=dict(x=1.3, y=1.3, z=1.3)  # Adjust x, y, z for zoom
-            )
-        ),
-        margin = dict(l=10, r=10, t=40, b=10)  # Margin values
-
-    )
-    return fig
\ No newline at end of file
+    fig.update_layout(title=title, scene_xaxis_title=x_label, scene_yaxis_title=y_label, scene_zaxis_title=z_label)
+    return fig
+
+# Function to plot the surface of a DataFrame, columns and index being the x and y axes
+def plot_surface(data, x_label, y_label, z_label, **kwargs):
+    return plot_surface_arr(data.to_numpy(), data.columns.to_numpy(), data.index.to_numpy(), x_label, y_label,
+                            z_label, **kwargs)